@@ -18,12 +18,59 @@ results are purely illustrative, the workflow reflects best practices
 for reproducible analysis.
 """
 
+import os
 import sqlite3
+from concurrent.futures import ProcessPoolExecutor
+from functools import cache
 from pathlib import Path
 import pandas as pd
 import numpy as np
+import matplotlib
 import matplotlib.pyplot as plt
 
+try:
+    import numba
+except ImportError:  # Numba is optional; fall back to plain NumPy
+    numba = None
+
+
+def _njit(**kwargs):
+    """Compile with ``numba.njit`` when Numba is installed, else leave as Python."""
+    if numba is None:
+        return lambda func: func
+    return numba.njit(**kwargs)
+
+
+_prange = range if numba is None else numba.prange
+
+try:
+    import numexpr
+except ImportError:  # NumExpr is optional; fall back to plain NumPy
+    numexpr = None
+
+
+def _log_ratio(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    """Elementwise ``log(numerator / denominator)``, fused by NumExpr when installed."""
+    if numexpr is None:
+        return np.log(numerator / denominator)
+    return numexpr.evaluate('log(numerator / denominator)')
+
+
+def _percent_to_decimal(values: np.ndarray) -> np.ndarray:
+    """Elementwise ``values / 100``, evaluated by NumExpr when installed."""
+    if numexpr is None:
+        return values / 100.0
+    return numexpr.evaluate('values / 100.0')
+
+
+def iso_date_key(dates: pd.Series) -> pd.Series:
+    """Convert ISO ``YYYY-MM-DD`` date strings to integer ``YYYYMMDD`` keys.
+
+    Integer keys join and sort faster than variable-length strings and
+    match the date format of the Fama–French factor data.
+    """
+    return dates.str.replace('-', '', regex=False).astype(np.int64)
+
 
 def compute_asset_returns(prices: pd.DataFrame) -> pd.DataFrame:
     """Calculate daily log returns for each asset.
@@ -41,15 +88,27 @@ def compute_asset_returns(prices: pd.DataFrame) -> pd.DataFrame:
         because they aggregate naturally and are common in risk
         management applications.
     """
-    # Pivot to wide format to compute returns by group easily
-    wide = prices.pivot(index='date', columns='asset', values='adj_close').astype(float)
-    # Sort by date to ensure correct ordering
-    wide = wide.sort_index()
-    # Compute log returns
-    returns = np.log(wide / wide.shift(1)).dropna()
-    # Melt back to long format
-    ret_long = returns.reset_index().melt(id_vars='date', var_name='asset', value_name='return')
-    return ret_long
+    # Work in long form, ordered by asset then date, so each asset's prices are
+    # contiguous and returns can be taken as a single shifted difference
+    prices = prices.sort_values(['asset', 'date'])
+    # Compare categorical assets by their integer codes rather than by name
+    if isinstance(prices['asset'].dtype, pd.CategoricalDtype):
+        assets = prices['asset'].cat.codes.to_numpy()
+    else:
+        assets = prices['asset'].to_numpy()
+    adj_close = prices['adj_close'].to_numpy(dtype=np.float64)
+    returns = np.empty_like(adj_close)
+    returns[1:] = _log_ratio(adj_close[1:], adj_close[:-1])
+    # The first observation of each asset has no prior price to difference against
+    first_obs = np.ones(len(assets), dtype=bool)
+    first_obs[1:] = assets[1:] != assets[:-1]
+    returns[first_obs] = np.nan
+    ret_long = pd.DataFrame({
+        'date': prices['date'].to_numpy(),
+        'asset': prices['asset'].array,
+        'return': returns,
+    })
+    return ret_long.dropna().reset_index(drop=True)
 
 
 def build_portfolio_returns(returns: pd.DataFrame, positions: pd.DataFrame) -> pd.DataFrame:
@@ -66,57 +125,231 @@ def build_portfolio_returns(returns: pd.DataFrame, positions: pd.DataFrame) -> p
     -------
     DataFrame
         Indexed by ``date`` with columns ``fund_id`` and ``portfolio_return``.
-        Contains portfolio log returns for each fund on each date where all
-        underlying asset returns are available.
+        Contains portfolio log returns for each fund on each date, averaged
+        over the fund's assets that have a return on that date.
     """
-    # Merge returns with positions
-    merged = returns.merge(positions, on='asset', how='inner')
-    # Weight returns by position quantity relative to portfolio market value on each date
-    # First compute daily contributions for each fund
-    merged['weighted_return'] = merged['return'] * merged['quantity']
-    # Sum contributions per fund/date and normalise by total quantity to get average return
-    grouped = merged.groupby(['date', 'fund_id'])
-    portfolio_returns = grouped.apply(
-        lambda df: df['weighted_return'].sum() / df['quantity'].sum()
-    ).reset_index(name='portfolio_return')
+    # Lay returns out as a dense dates x assets matrix and positions as an
+    # assets x funds matrix so every (date, fund) pair comes from one matmul
+    returns_wide = returns.pivot(index='date', columns='asset', values='return').sort_index()
+    quantities = (
+        positions.pivot_table(index='asset', columns='fund_id', values='quantity', aggfunc='sum', observed=True)
+        .reindex(returns_wide.columns)
+        .fillna(0.0)
+    )
+    R = returns_wide.to_numpy(dtype=np.float64)
+    Q = quantities.to_numpy(dtype=np.float64)
+    available = ~np.isnan(R)
+    # Weight returns by position quantity and normalise by the total quantity of
+    # the assets actually observed on each date, i.e. a quantity-weighted average
+    weighted = np.where(available, R, 0.0) @ Q
+    total_quantity = available.astype(np.float64) @ Q
+    with np.errstate(invalid='ignore', divide='ignore'):
+        port = weighted / total_quantity
+    portfolio_returns = (
+        pd.DataFrame(port, index=returns_wide.index, columns=quantities.columns)
+        .stack()
+        .rename('portfolio_return')
+        .reset_index()
+    )
+    # Drop pairs with no quantity on any observed asset, which have no return
+    portfolio_returns = portfolio_returns[np.isfinite(portfolio_returns['portfolio_return'])]
+    portfolio_returns = portfolio_returns.reset_index(drop=True)
     # Convert date to string to align with factors
     portfolio_returns['date'] = portfolio_returns['date'].astype(str)
     return portfolio_returns
 
 
+CACHED_TABLES = ['factor_returns', 'asset_prices', 'positions', 'funds']
+
+
+def load_cached_tables(cache_dir: Path, db_path: Path):
+    """Load the database tables from the Parquet cache, if available.
+
+    The SQLite database remains the source of truth, so the cache is only
+    used when every file is at least as new as the database.
+
+    Parameters
+    ----------
+    cache_dir : Path
+        Directory holding the ``<table>.parquet`` files written by
+        ``create_database.py``.
+    db_path : Path
+        Path to the SQLite database the cache was written from.
+
+    Returns
+    -------
+    dict or None
+        Mapping of table name to DataFrame, or ``None`` when the cache is
+        incomplete, older than the database, unreadable or no Parquet
+        engine is installed, in which case the SQLite database should be
+        used instead.
+    """
+    paths = {name: cache_dir / f'{name}.parquet' for name in CACHED_TABLES}
+    try:
+        db_mtime = db_path.stat().st_mtime if db_path.exists() else None
+        if db_mtime is not None and any(path.stat().st_mtime < db_mtime for path in paths.values()):
+            return None
+        return {name: pd.read_parquet(path) for name, path in paths.items()}
+    except (ImportError, OSError, ValueError):
+        # Missing files raise FileNotFoundError (an OSError); truncated or
+        # corrupt files raise OSError or pyarrow.ArrowInvalid (a ValueError)
+        return None
+
+
+PORTFOLIO_RETURNS_SQL = """
+    WITH asset_returns AS (
+        SELECT
+            date,
+            asset,
+            ln(adj_close / LAG(adj_close) OVER (PARTITION BY asset ORDER BY date)) AS return
+        FROM asset_prices
+    )
+    SELECT
+        r.date,
+        p.fund_id,
+        SUM(r.return * p.quantity) / SUM(p.quantity) AS portfolio_return
+    FROM asset_returns AS r
+    JOIN positions AS p ON p.asset = r.asset
+    WHERE r.return IS NOT NULL
+    GROUP BY r.date, p.fund_id
+    HAVING SUM(p.quantity) <> 0
+    ORDER BY r.date, p.fund_id
+"""
+
+
+def load_portfolio_returns(conn: sqlite3.Connection) -> pd.DataFrame:
+    """Compute portfolio returns directly in the database.
+
+    Equivalent to ``build_portfolio_returns(compute_asset_returns(prices),
+    positions)`` on the ``asset_prices`` and ``positions`` tables, but the
+    per-asset log returns (via the ``LAG`` window function), the join with
+    positions and the aggregation all run in SQLite.
+
+    Parameters
+    ----------
+    conn : sqlite3.Connection
+        Open connection to the risk management database.
+
+    Returns
+    -------
+    DataFrame
+        Columns ``date``, ``fund_id`` and ``portfolio_return``.
+    """
+    # ln() is only built in when SQLite is compiled with its math functions
+    try:
+        conn.execute('SELECT ln(1)')
+    except sqlite3.OperationalError:
+        conn.create_function('ln', 1, lambda x: float(np.log(x)) if x is not None else None, deterministic=True)
+    return pd.read_sql_query(PORTFOLIO_RETURNS_SQL, conn)
+
+
+FACTOR_COLUMNS = ['mkt_rf', 'smb', 'hml', 'rmw', 'cma']
+
+# Above this condition number of X'X the normal equations lose too much
+# precision (or are singular) and least squares is used instead
+MAX_NORMAL_EQUATIONS_COND = 1e10
+
+
 def estimate_factor_exposures(portfolio_returns: pd.Series, factor_df: pd.DataFrame) -> (np.ndarray, float):
     """Estimate factor betas and alpha for a series of portfolio excess returns.
 
     Uses ordinary least squares regression without an intercept term on
-    factor returns.  The intercept (alpha) is computed separately as
-    the average of the residuals.
+    factor returns, solved via the normal equations (or least squares when
+    the factors are rank-deficient).  The intercept (alpha) is computed
+    separately as the average of the residuals.
+
+    Several portfolios sharing the same dates can be estimated at once by
+    passing their excess returns as the columns of a DataFrame; all of them
+    are then solved against the same factor matrix in a single call.
 
     Parameters
     ----------
-    portfolio_returns : Series
-        Excess returns of the portfolio (already subtracted the risk–free rate).
-    factor_df : DataFrame
+    portfolio_returns : Series or DataFrame
+        Excess returns of the portfolio (already subtracted the risk–free rate),
+        or a DataFrame with one column of excess returns per portfolio.
+    factor_df : DataFrame or ndarray
         DataFrame of factor returns aligned with portfolio returns.  Should
-        contain columns ``mkt_rf``, ``smb``, ``hml``, ``rmw``, ``cma``.
+        contain columns ``mkt_rf``, ``smb``, ``hml``, ``rmw``, ``cma``.  An
+        ndarray of shape (n, 5) with the factors in that order is used as is.
 
     Returns
     -------
     (betas, alpha)
-        betas : ndarray of shape (5,) containing factor loadings.
-        alpha : float representing the average unexplained return.
+        betas : ndarray of shape (5,) containing factor loadings, or
+            (5, n_portfolios) when a DataFrame is passed.
+        alpha : float representing the average unexplained return, or an
+            ndarray of shape (n_portfolios,) when a DataFrame is passed.
     """
-    # Prepare design matrix X and response vector y
-    X = factor_df[['mkt_rf', 'smb', 'hml', 'rmw', 'cma']].to_numpy()
-    y = portfolio_returns.to_numpy()
-    # Solve least squares for betas
-    betas, *_ = np.linalg.lstsq(X, y, rcond=None)
-    # Compute residuals and alpha
-    fitted = X @ betas
-    residuals = y - fitted
-    alpha = residuals.mean()
+    # Prepare design matrix X and response vector (or matrix) y
+    if isinstance(factor_df, pd.DataFrame):
+        X = factor_df[FACTOR_COLUMNS].to_numpy(dtype=np.float64)
+    else:
+        X = factor_df
+    y = np.asarray(portfolio_returns, dtype=np.float64)
+    # Solve the 5x5 normal equations X'X b = X'y for betas.  With fewer dates
+    # than factors, or nearly collinear factors, X'X is singular or
+    # ill-conditioned; use the minimum-norm least squares solution instead.
+    XtX = X.T @ X
+    if X.shape[0] < X.shape[1] or np.linalg.cond(XtX) > MAX_NORMAL_EQUATIONS_COND:
+        betas, *_ = np.linalg.lstsq(X, y, rcond=None)
+    else:
+        betas = np.linalg.solve(XtX, X.T @ y)
+    # Alpha is the mean residual, which equals mean(y) - mean(X) @ betas
+    alpha = y.mean(axis=0) - X.mean(axis=0) @ betas
     return betas, alpha
 
 
+@_njit(cache=True)
+def _var_es(r: np.ndarray, confidence: float) -> (float, float):
+    """Historical VaR and ES of a one-dimensional float32 or float64 array."""
+    # Compute VaR as negative of lower quantile.  Only the two order statistics
+    # either side of the quantile are needed, so partition rather than sort and
+    # interpolate between them exactly as np.quantile's default method does.
+    pos = (r.size - 1) * (1.0 - confidence)
+    k = int(np.floor(pos))
+    k_next = min(k + 1, r.size - 1)
+    part = np.partition(r, k_next)
+    # Everything ahead of k_next is no larger than it, so the lower order
+    # statistic is the largest of that prefix
+    lower = part[:k_next].max() if k_next > k else part[k]
+    upper = part[k_next]
+    # Like NumPy, round the interpolation weights to the input's precision and
+    # interpolate in that precision.  pos is often a whole number plus rounding
+    # error (e.g. 20 * (1 - 0.95)), so any other arithmetic can move the
+    # threshold off the order statistic and change which returns form the tail.
+    gamma = pos - k
+    weights = np.empty(2, dtype=r.dtype)
+    weights[0] = gamma
+    weights[1] = 1.0 - gamma
+    diff = upper - lower
+    if gamma >= 0.5:
+        var_threshold = upper - diff * weights[1]
+    else:
+        var_threshold = lower + diff * weights[0]
+    # Expected Shortfall is mean of losses beyond VaR; all of them lie in the
+    # partitioned prefix up to the lower order statistic
+    tail = part[:k + 1]
+    tail = tail[tail < var_threshold].astype(np.float64)
+    es = -tail.mean() if tail.size > 0 else np.nan
+    return -var_threshold, es
+
+
+# The same kernel as plain NumPy, for single calls where compiling it would
+# cost far more than it saves
+_var_es_numpy = getattr(_var_es, 'py_func', _var_es)
+
+
+@_njit(cache=True, parallel=True)
+def _var_es_batch(windows: np.ndarray, confidence: float) -> (np.ndarray, np.ndarray):
+    """Row-wise historical VaR and ES of a two-dimensional float64 array."""
+    n = windows.shape[0]
+    var = np.empty(n)
+    es = np.empty(n)
+    for i in _prange(n):
+        var[i], es[i] = _var_es(windows[i], confidence)
+    return var, es
+
+
 def compute_var_es(returns: pd.Series, confidence: float = 0.95) -> (float, float):
     """Compute historical Value at Risk and Expected Shortfall.
 
@@ -126,7 +359,8 @@ def compute_var_es(returns: pd.Series, confidence: float = 0.95) -> (float, floa
     Parameters
     ----------
     returns : Series
-        Series of portfolio returns.
+        Series of portfolio returns.  float32 returns are kept in single
+        precision; any other dtype is converted to float64.
     confidence : float, optional
         Confidence level for VaR; default 0.95 corresponding to 95% VaR.
 
@@ -137,36 +371,88 @@ def compute_var_es(returns: pd.Series, confidence: float = 0.95) -> (float, floa
         es : float, Expected Shortfall (positive number)
     """
     # Convert to numpy array
-    r = returns.to_numpy()
-    # Compute VaR as negative of lower quantile
-    var_threshold = np.quantile(r, 1 - confidence)
-    var = -var_threshold
-    # Expected Shortfall is mean of losses beyond VaR
-    tail_losses = r[r < var_threshold]
-    es = -tail_losses.mean() if len(tail_losses) > 0 else np.nan
-    return var, es
+    r = returns.to_numpy(dtype=np.result_type(returns.dtype, np.float32))
+    # A single call runs in plain NumPy; use compute_var_es_batch for many windows
+    return _var_es_numpy(r, confidence)
+
+
+def compute_var_es_batch(windows: np.ndarray, confidence: float = 0.95) -> (np.ndarray, np.ndarray):
+    """Compute historical VaR and ES for many return windows at once.
+
+    Intended for rolling-window or backtest use, where ``compute_var_es``
+    would otherwise be called repeatedly on small arrays.  When Numba is
+    available the windows are processed in parallel as native code.  The
+    kernel is compiled on first use and cached on disk; that first call
+    (after a fresh checkout or any edit to this module) takes several
+    seconds, so prefer ``compute_var_es`` for a handful of windows.
+
+    Parameters
+    ----------
+    windows : ndarray
+        Array of shape (n_windows, window_length); each row is one sample of
+        portfolio returns.
+    confidence : float, optional
+        Confidence level for VaR; default 0.95 corresponding to 95% VaR.
 
+    Returns
+    -------
+    (var, es)
+        var : ndarray of shape (n_windows,) with the Value at Risk of each row.
+        es : ndarray of shape (n_windows,) with the Expected Shortfall of each row.
+    """
+    windows = np.ascontiguousarray(windows, dtype=np.float64)
+    return _var_es_batch(windows, confidence)
+
+
+def _start_plot(ax, figsize):
+    """Return a cleared Axes to draw on, creating a new figure if none is given."""
+    if ax is None:
+        _, ax = plt.subplots(figsize=figsize)
+    else:
+        ax.clear()
+    return ax
 
-def plot_cumulative_returns(portfolio_returns: pd.DataFrame, fund_id: int, output_path: Path) -> None:
+
+def _finish_plot(ax, output_path: Path, owns_figure: bool) -> None:
+    """Save the figure holding ``ax`` and close it if it was created for this plot."""
+    fig = ax.figure
+    fig.tight_layout()
+    fig.savefig(output_path)
+    if owns_figure:
+        plt.close(fig)
+
+
+def plot_cumulative_returns(portfolio_returns: pd.DataFrame, fund_id: int, output_path: Path,
+                            ax: plt.Axes = None) -> None:
     """Plot cumulative returns for a specific fund.
 
-    Saves the figure to the provided path.
+    Saves the figure to the provided path.  When ``ax`` is given it is
+    cleared and reused, which avoids creating a new figure per plot.
     """
-    fund_data = portfolio_returns[portfolio_returns['fund_id'] == fund_id].copy()
+    # Work on the two needed columns as arrays; filtering copies only those
+    dates = portfolio_returns['date'].to_numpy()
+    returns = portfolio_returns['portfolio_return'].to_numpy()
+    fund_rows = portfolio_returns['fund_id'].to_numpy() == fund_id
+    # A frame that already holds only this fund needs no filtering
+    if not fund_rows.all():
+        dates = dates[fund_rows]
+        returns = returns[fund_rows]
     # Sort by date to compute cumulative returns
-    fund_data = fund_data.sort_values('date')
-    cum_returns = np.exp(fund_data['portfolio_return'].cumsum()) - 1
-    plt.figure(figsize=(8, 4))
-    plt.plot(fund_data['date'], cum_returns, label=f'Fund {fund_id}')
-    plt.xticks(rotation=45)
-    plt.ylabel('Cumulative Return')
-    plt.title(f'Cumulative Returns for Fund {fund_id}')
-    plt.tight_layout()
-    plt.savefig(output_path)
-    plt.close()
-
-
-def plot_return_distribution(returns: pd.Series, var: float, fund_id: int, output_path: Path) -> None:
+    order = np.argsort(dates, kind='stable')
+    dates = dates[order]
+    # expm1 keeps precision for the small cumulative returns near the start
+    cum_returns = np.expm1(np.cumsum(returns[order]))
+    owns_figure = ax is None
+    ax = _start_plot(ax, figsize=(8, 4))
+    ax.plot(dates, cum_returns, label=f'Fund {fund_id}')
+    ax.tick_params(axis='x', labelrotation=45)
+    ax.set_ylabel('Cumulative Return')
+    ax.set_title(f'Cumulative Returns for Fund {fund_id}')
+    _finish_plot(ax, output_path, owns_figure)
+
+
+def plot_return_distribution(returns: pd.Series, var: float, fund_id: int, output_path: Path,
+                             ax: plt.Axes = None) -> None:
     """Plot the distribution of portfolio returns with VaR threshold indicated.
 
     Parameters
@@ -179,20 +465,22 @@ def plot_return_distribution(returns: pd.Series, var: float, fund_id: int, outpu
         Identifier of the fund.
     output_path : Path
         Path to save the figure.
+    ax : Axes, optional
+        Axes to clear and draw on.  A new figure is created if omitted.
     """
-    plt.figure(figsize=(6, 4))
-    plt.hist(returns, bins=50, alpha=0.7, color='steelblue', edgecolor='black')
-    plt.axvline(-var, color='red', linestyle='--', linewidth=2, label=f'VaR (95%) = {-var:.4f}')
-    plt.xlabel('Return')
-    plt.ylabel('Frequency')
-    plt.title(f'Return Distribution for Fund {fund_id}')
-    plt.legend()
-    plt.tight_layout()
-    plt.savefig(output_path)
-    plt.close()
-
-
-def plot_factor_exposures(betas: np.ndarray, fund_id: int, output_path: Path) -> None:
+    owns_figure = ax is None
+    ax = _start_plot(ax, figsize=(6, 4))
+    ax.hist(returns, bins=50, alpha=0.7, color='steelblue', edgecolor='black')
+    ax.axvline(-var, color='red', linestyle='--', linewidth=2, label=f'VaR (95%) = {-var:.4f}')
+    ax.set_xlabel('Return')
+    ax.set_ylabel('Frequency')
+    ax.set_title(f'Return Distribution for Fund {fund_id}')
+    ax.legend()
+    _finish_plot(ax, output_path, owns_figure)
+
+
+def plot_factor_exposures(betas: np.ndarray, fund_id: int, output_path: Path,
+                          ax: plt.Axes = None) -> None:
     """Plot a bar chart of factor exposures (betas).
 
     Parameters
@@ -203,15 +491,80 @@ def plot_factor_exposures(betas: np.ndarray, fund_id: int, output_path: Path) ->
         Fund identifier.
     output_path : Path
         Destination for the figure file.
+    ax : Axes, optional
+        Axes to clear and draw on.  A new figure is created if omitted.
     """
     factors = ['Mkt-RF', 'SMB', 'HML', 'RMW', 'CMA']
-    plt.figure(figsize=(6, 4))
-    plt.bar(factors, betas, color='teal')
-    plt.ylabel('Beta')
-    plt.title(f'Factor Exposures for Fund {fund_id}')
-    plt.tight_layout()
-    plt.savefig(output_path)
-    plt.close()
+    owns_figure = ax is None
+    ax = _start_plot(ax, figsize=(6, 4))
+    ax.bar(factors, betas, color='teal')
+    ax.set_ylabel('Beta')
+    ax.set_title(f'Factor Exposures for Fund {fund_id}')
+    _finish_plot(ax, output_path, owns_figure)
+
+
+def _init_worker() -> None:
+    """Select the non-interactive backend in worker processes, which only save figures."""
+    matplotlib.use('Agg')
+
+
+@cache
+def _shared_axes():
+    """Create one figure per plot type, reused for every fund in this process.
+
+    In worker processes the figures last until the pool shuts down at the
+    end of ``main``; when funds are analysed in-process ``main`` closes them.
+    """
+    _, ax_cum = plt.subplots(figsize=(8, 4))
+    _, ax_hist = plt.subplots(figsize=(6, 4))
+    _, ax_bar = plt.subplots(figsize=(6, 4))
+    return ax_cum, ax_hist, ax_bar
+
+
+def analyze_fund(job: tuple) -> dict:
+    """Compute risk metrics and write the plots for a single fund.
+
+    Takes a single picklable tuple so that funds can be processed in
+    parallel with ``ProcessPoolExecutor.map``.
+
+    Parameters
+    ----------
+    job : tuple
+        ``(fund_id, fund_name, fund_ret, betas, alpha, results_dir)`` where
+        ``fund_ret`` is the fund's DataFrame of ``date``, ``fund_id`` and
+        ``portfolio_return``, and ``betas``/``alpha`` are its estimated
+        factor exposures.
+
+    Returns
+    -------
+    dict
+        The fund's row of summary metrics.
+    """
+    fund_id, fund_name, fund_ret, betas, alpha, results_dir = job
+    ax_cum, ax_hist, ax_bar = _shared_axes()
+    # Compute VaR and ES on simple (not excess) returns.  Single precision
+    # is ample for the partition and histogram, and halves memory traffic;
+    # the regression stays in float64.
+    fund_ret_f32 = fund_ret['portfolio_return'].astype(np.float32)
+    var, es = compute_var_es(fund_ret_f32)
+    # Plot cumulative returns
+    plot_cumulative_returns(fund_ret, fund_id, results_dir / f'fund{fund_id}_cumulative_returns.png', ax=ax_cum)
+    # Plot return distribution with VaR
+    plot_return_distribution(fund_ret_f32, var, fund_id, results_dir / f'fund{fund_id}_return_distribution.png', ax=ax_hist)
+    # Plot factor exposures
+    plot_factor_exposures(betas, fund_id, results_dir / f'fund{fund_id}_factor_exposures.png', ax=ax_bar)
+    return {
+        'fund_id': fund_id,
+        'fund_name': fund_name,
+        'alpha': alpha,
+        'beta_mkt_rf': betas[0],
+        'beta_smb': betas[1],
+        'beta_hml': betas[2],
+        'beta_rmw': betas[3],
+        'beta_cma': betas[4],
+        'VaR_95': var,
+        'ES_95': es,
+    }
 
 
 def main():
@@ -220,66 +573,104 @@ def main():
     results_dir = project_dir / 'results'
     results_dir.mkdir(exist_ok=True)
 
-    # Connect to database and load tables into pandas
-    conn = sqlite3.connect(db_path)
-    factor_df = pd.read_sql_query('SELECT * FROM factor_returns', conn)
-    # Harmonise date format: convert factor dates from YYYYMMDD to YYYY-MM-DD
+    # Prefer the Parquet copy of the tables written by create_database.py,
+    # which loads without SQLite's row-by-row decoding, unless it is stale
+    tables = load_cached_tables(project_dir / 'cache', db_path)
+    if tables is not None:
+        factor_df = tables['factor_returns']
+        funds_df = tables['funds']
+        # Encode assets as categoricals sharing one set of categories, so the
+        # grouping and reshaping below work on small integer codes
+        asset_dtype = pd.CategoricalDtype(
+            pd.concat([tables['asset_prices']['asset'], tables['positions']['asset']]).unique()
+        )
+        for name in ('asset_prices', 'positions'):
+            tables[name]['asset'] = tables[name]['asset'].astype(asset_dtype)
+        # Compute asset returns and build portfolio returns
+        returns_df = compute_asset_returns(tables['asset_prices'])
+        portfolio_returns = build_portfolio_returns(returns_df, tables['positions'])
+    else:
+        # Connect to database and load tables into pandas
+        conn = sqlite3.connect(db_path)
+        factor_df = pd.read_sql_query('SELECT * FROM factor_returns', conn)
+        # Compute asset and portfolio returns inside SQLite so only the
+        # aggregated (date, fund) rows are transferred into pandas
+        portfolio_returns = load_portfolio_returns(conn)
+        funds_df = pd.read_sql_query('SELECT * FROM funds', conn)
+        conn.close()
+
+    # Harmonise date format: key factor dates by the integer YYYYMMDD
     # The Fama–French factors are stored as strings without dashes (e.g., 20171218).  Our
     # portfolio returns use ISO format (YYYY-MM-DD).  To align these two datasets,
-    # convert the factor dates to ISO format before merging.  Without this
-    # conversion there would be no overlapping dates because the strings differ.
-    factor_df['date'] = pd.to_datetime(factor_df['date'], format='%Y%m%d').dt.strftime('%Y-%m-%d')
-    prices_df = pd.read_sql_query('SELECT * FROM asset_prices', conn)
-    positions_df = pd.read_sql_query('SELECT * FROM positions', conn)
-    funds_df = pd.read_sql_query('SELECT * FROM funds', conn)
-    conn.close()
-
-    # Compute asset returns
-    returns_df = compute_asset_returns(prices_df)
-    # Build portfolio returns
-    portfolio_returns = build_portfolio_returns(returns_df, positions_df)
+    # both are converted to integer YYYYMMDD keys before merging, which also
+    # makes the join hash fixed-width integers rather than strings.
+    factor_df['date_key'] = factor_df.pop('date').astype(np.int64)
+
     # Write portfolio returns to CSV
     portfolio_returns.to_csv(results_dir / 'portfolio_returns.csv', index=False)
-
-    # Prepare storage for summary metrics
-    summary_records = []
-
+    portfolio_returns['date_key'] = iso_date_key(portfolio_returns['date'])
+
+    # Convert factor returns from percent to decimal once, as a contiguous
+    # float64 block with one row per factor date
+    factor_np = np.ascontiguousarray(_percent_to_decimal(factor_df[FACTOR_COLUMNS].to_numpy(dtype=np.float64)))
+    rf = _percent_to_decimal(factor_df['rf'].to_numpy(dtype=np.float64))
+    # Align every fund's returns with the factor returns by looking up the
+    # factor row of each date (-1 when there is no factor data), then split
+    # by fund once rather than filtering and merging per fund
+    portfolio_returns['factor_row'] = pd.Index(factor_df['date_key']).get_indexer(portfolio_returns['date_key'])
+    aligned = portfolio_returns[portfolio_returns['factor_row'] >= 0]
+    returns_by_fund = dict(list(portfolio_returns.groupby('fund_id', sort=False)))
+    aligned_by_fund = dict(list(aligned.groupby('fund_id', sort=False)))
+
+    # Estimate factor exposures for all funds in one solve.  Funds observed on
+    # every aligned date share the same factor matrix, so their excess returns
+    # are stacked as columns; any fund with gaps is estimated on its own below.
+    returns_wide = aligned.pivot(index='factor_row', columns='fund_id', values='portfolio_return')
+    rows = returns_wide.index.to_numpy()
+    # Compute excess portfolio returns by subtracting RF
+    excess_wide = returns_wide.sub(rf[rows], axis=0)
+    complete_funds = excess_wide.columns[excess_wide.notna().all()]
+    exposures = {}
+    if len(complete_funds) > 0:
+        betas_all, alphas_all = estimate_factor_exposures(excess_wide[complete_funds], factor_np[rows])
+        for i, fund_id in enumerate(complete_funds):
+            exposures[fund_id] = (betas_all[:, i], alphas_all[i])
+
+    # Collect the per-fund work; risk metrics and plots then run in parallel
+    jobs = []
     for fund_id, fund_name in funds_df.itertuples(index=False):
-        # Extract returns for this fund
-        fund_ret = portfolio_returns[portfolio_returns['fund_id'] == fund_id].copy()
-        # Align with factor returns on date
-        merged = fund_ret.merge(factor_df, on='date', how='inner')
-        if merged.empty:
+        # Extract returns for this fund and their alignment with factor returns
+        fund_ret = returns_by_fund.get(fund_id)
+        aligned_ret = aligned_by_fund.get(fund_id)
+        if aligned_ret is None:
             print(f"No overlapping dates between fund {fund_id} returns and factor data.")
             continue
-        # Compute excess portfolio returns by subtracting RF (converted to decimal)
-        merged['excess_portfolio_return'] = merged['portfolio_return'] - merged['rf']/100.0
-        # Convert factor returns from percent to decimal
-        for col in ['mkt_rf', 'smb', 'hml', 'rmw', 'cma', 'rf']:
-            merged[col] = merged[col] / 100.0
-        # Estimate factor exposures
-        betas, alpha = estimate_factor_exposures(merged['excess_portfolio_return'], merged)
-        # Compute VaR and ES on simple (not excess) returns
-        var, es = compute_var_es(fund_ret['portfolio_return'])
-        # Append summary
-        summary_records.append({
-            'fund_id': fund_id,
-            'fund_name': fund_name,
-            'alpha': alpha,
-            'beta_mkt_rf': betas[0],
-            'beta_smb': betas[1],
-            'beta_hml': betas[2],
-            'beta_rmw': betas[3],
-            'beta_cma': betas[4],
-            'VaR_95': var,
-            'ES_95': es,
-        })
-        # Plot cumulative returns
-        plot_cumulative_returns(portfolio_returns, fund_id, results_dir / f'fund{fund_id}_cumulative_returns.png')
-        # Plot return distribution with VaR
-        plot_return_distribution(fund_ret['portfolio_return'], var, fund_id, results_dir / f'fund{fund_id}_return_distribution.png')
-        # Plot factor exposures
-        plot_factor_exposures(betas, fund_id, results_dir / f'fund{fund_id}_factor_exposures.png')
+        # Look up factor exposures, estimating them individually if not batched
+        if fund_id in exposures:
+            betas, alpha = exposures[fund_id]
+        else:
+            rows = aligned_ret['factor_row'].to_numpy()
+            excess_ret = aligned_ret['portfolio_return'].to_numpy() - rf[rows]
+            betas, alpha = estimate_factor_exposures(excess_ret, factor_np[rows])
+        # Send workers only the columns they need
+        fund_ret = fund_ret[['date', 'fund_id', 'portfolio_return']]
+        jobs.append((fund_id, fund_name, fund_ret, betas, alpha, results_dir))
+
+    # Prepare storage for summary metrics
+    summary_records = []
+    n_workers = min(len(jobs), os.cpu_count() or 1)
+    if n_workers > 1:
+        # One process per fund up to the core count.  Small chunks keep the
+        # workers balanced; each worker reuses its figures across its funds.
+        chunksize = max(1, len(jobs) // (4 * n_workers))
+        with ProcessPoolExecutor(max_workers=n_workers, initializer=_init_worker) as executor:
+            summary_records = list(executor.map(analyze_fund, jobs, chunksize=chunksize))
+    elif jobs:
+        # Starting a pool of one would only add overhead
+        summary_records = [analyze_fund(job) for job in jobs]
+        for ax in _shared_axes():
+            plt.close(ax.figure)
+        _shared_axes.cache_clear()
 
     # Save summary metrics
     summary_df = pd.DataFrame(summary_records)
@@ -60,29 +60,67 @@ def load_prices(csv_path: Path, asset_name: str) -> pd.DataFrame:
         DataFrame with columns: date, asset, open, high, low, close,
         adj_close, volume.  Dates are strings.
     """
-    df = pd.read_csv(csv_path)
+    # Price downloads mark missing values as 'null'; treating it as NaN lets the
+    # C parser read the numeric columns as floats directly
+    df = pd.read_csv(csv_path, na_values=['null'])
     # Some files have extra blank lines; drop rows where date is NaN
     df = df.dropna(subset=['Date'])
     df.columns = [c.strip().lower().replace(' ', '_') for c in df.columns]
     df['date'] = df['date'].astype(str)
     df['asset'] = asset_name
-    # Ensure numeric columns are floats
+    # Ensure numeric columns are numeric, coercing only those the parser could
+    # not already read as numbers, in a single pass over the block
     numeric_cols = ['open', 'high', 'low', 'close', 'adj_close', 'volume']
-    for col in numeric_cols:
-        df[col] = pd.to_numeric(df[col], errors='coerce')
+    unparsed = [col for col in numeric_cols if not pd.api.types.is_numeric_dtype(df[col])]
+    if unparsed:
+        df[unparsed] = df[unparsed].apply(pd.to_numeric, errors='coerce')
     return df[['date', 'asset', 'open', 'high', 'low', 'close', 'adj_close', 'volume']]
 
 
+def write_parquet_cache(cache_dir: Path, tables: dict) -> None:
+    """Write a copy of each table as a Parquet file for faster loading.
+
+    The analysis script reads these columnar files in preference to the
+    SQLite database when they are present.  If no Parquet engine (such as
+    pyarrow) is installed the cache is skipped and the database is used.
+
+    Parameters
+    ----------
+    cache_dir : Path
+        Directory in which to write ``<table>.parquet`` files.
+    tables : dict
+        Mapping of table name to the DataFrame holding its rows.
+    """
+    cache_dir.mkdir(exist_ok=True)
+    try:
+        for name, df in tables.items():
+            df.to_parquet(cache_dir / f'{name}.parquet', index=False)
+    except ImportError:
+        # Do not leave a partial cache behind
+        for path in cache_dir.glob('*.parquet'):
+            path.unlink()
+        print("No Parquet engine installed; skipping the Parquet cache.")
+        return
+    print(f"Parquet cache written to {cache_dir}")
+
+
 def main():
     project_dir = Path(__file__).resolve().parent.parent
     data_dir = project_dir / 'data'
     db_path = project_dir / 'risk_management.db'
-    # Remove existing database to start fresh
+    cache_dir = project_dir / 'cache'
+    # Remove existing database and cached tables to start fresh
     if db_path.exists():
         db_path.unlink()
+    for path in cache_dir.glob('*.parquet'):
+        path.unlink()
 
     conn = sqlite3.connect(db_path)
     cur = conn.cursor()
+    # The database is rebuilt from scratch on every run, so there is nothing to
+    # protect by syncing each write to disk or keeping a rollback journal file
+    cur.execute('PRAGMA synchronous = OFF')
+    cur.execute('PRAGMA journal_mode = MEMORY')
 
     # Create tables
     cur.execute("""
@@ -130,7 +168,12 @@ def main():
     # Load and insert factor data
     factor_csv = data_dir / 'fama_french_5factors.csv'
     factors_df = load_factors(factor_csv)
-    factors_df.to_sql('factor_returns', conn, if_exists='append', index=False)
+    # All inserts below run in one transaction, committed once at the end
+    cur.execute('BEGIN')
+    cur.executemany(
+        'INSERT INTO factor_returns (date, mkt_rf, smb, hml, rmw, cma, rf) VALUES (?, ?, ?, ?, ?, ?, ?)',
+        factors_df.itertuples(index=False, name=None),
+    )
 
     # Load and insert price data for each asset
     assets = {
@@ -138,9 +181,15 @@ def main():
         'AMZN': 'amzn.csv',
         'SPX': 'spx.csv',
     }
+    price_dfs = []
     for asset, filename in assets.items():
         df = load_prices(data_dir / filename, asset)
-        df.to_sql('asset_prices', conn, if_exists='append', index=False)
+        price_dfs.append(df)
+        cur.executemany(
+            'INSERT INTO asset_prices (date, asset, open, high, low, close, adj_close, volume) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+            df.itertuples(index=False, name=None),
+        )
 
     # Seed funds and positions
     funds = [
@@ -170,6 +219,13 @@ def main():
     conn.close()
     print(f"Database created at {db_path}")
 
+    write_parquet_cache(cache_dir, {
+        'factor_returns': factors_df,
+        'asset_prices': pd.concat(price_dfs, ignore_index=True),
+        'funds': pd.DataFrame(funds, columns=['fund_id', 'fund_name']),
+        'positions': pd.DataFrame(positions, columns=['fund_id', 'asset', 'quantity']).astype({'quantity': float}),
+    })
+
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
@@ -0,0 +1,142 @@
+import os
+import sqlite3
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from analyze_risk import (
+    CACHED_TABLES,
+    build_portfolio_returns,
+    compute_asset_returns,
+    compute_var_es,
+    compute_var_es_batch,
+    estimate_factor_exposures,
+    load_cached_tables,
+    load_portfolio_returns,
+)
+
+
+def reference_var_es(r, confidence=0.95):
+    # The original definitions: np.quantile for VaR and the mean of returns
+    # strictly below it for ES
+    q = np.quantile(r, 1 - confidence)
+    tail = r[r < q]
+    return -q, (-tail.mean() if len(tail) > 0 else np.nan)
+
+
+@pytest.mark.parametrize('n', [1, 2, 20, 21, 250, 1001])
+@pytest.mark.parametrize('dtype', [np.float64, np.float32])
+def test_var_es_matches_quantile(n, dtype):
+    # (n - 1) * (1 - 0.95) is a whole number plus rounding error for n = 21 and
+    # n = 1001, where the threshold must stay on the order statistic
+    rng = np.random.default_rng(n)
+    for _ in range(50):
+        r = rng.normal(scale=rng.choice([1.0, 0.01]), size=n).astype(dtype)
+        var, es = compute_var_es(pd.Series(r))
+        expected_var, expected_es = reference_var_es(r)
+        assert var == expected_var
+        np.testing.assert_allclose(es, expected_es, rtol=1e-6 if dtype == np.float32 else 1e-12)
+
+
+@pytest.mark.parametrize('window', [21, 250, 1001])
+def test_var_es_batch_matches_single(window):
+    rng = np.random.default_rng(window)
+    windows = rng.normal(scale=0.01, size=(40, window))
+    var, es = compute_var_es_batch(windows)
+    for i, row in enumerate(windows):
+        single_var, single_es = compute_var_es(pd.Series(row))
+        expected_var, expected_es = reference_var_es(row)
+        assert var[i] == single_var == expected_var
+        # Compiled and NumPy means may differ in summation order
+        np.testing.assert_allclose(es[i], single_es, rtol=1e-12)
+        np.testing.assert_allclose(es[i], expected_es, rtol=1e-12)
+
+
+def write_cache(cache_dir):
+    pytest.importorskip('pyarrow')
+    cache_dir.mkdir()
+    for name in CACHED_TABLES:
+        pd.DataFrame({'x': [1.0]}).to_parquet(cache_dir / f'{name}.parquet')
+
+
+def test_cache_used_when_newer_than_database(tmp_path):
+    db_path = tmp_path / 'risk_management.db'
+    db_path.touch()
+    os.utime(db_path, (0, 0))
+    write_cache(tmp_path / 'cache')
+    tables = load_cached_tables(tmp_path / 'cache', db_path)
+    assert sorted(tables) == sorted(CACHED_TABLES)
+
+
+def test_stale_cache_is_ignored(tmp_path):
+    write_cache(tmp_path / 'cache')
+    db_path = tmp_path / 'risk_management.db'
+    db_path.touch()
+    os.utime(tmp_path / 'cache' / 'funds.parquet', (0, 0))
+    assert load_cached_tables(tmp_path / 'cache', db_path) is None
+
+
+def test_corrupt_cache_is_ignored(tmp_path):
+    write_cache(tmp_path / 'cache')
+    path = tmp_path / 'cache' / 'asset_prices.parquet'
+    path.write_bytes(path.read_bytes()[:20])
+    assert load_cached_tables(tmp_path / 'cache', tmp_path / 'risk_management.db') is None
+
+
+@pytest.mark.parametrize('categorical', [False, True])
+def test_sql_and_pandas_portfolio_returns_match(categorical):
+    # Prices with missing dates per asset and null prices, as both code paths
+    # must handle them the same way
+    rng = np.random.default_rng(0)
+    dates = pd.date_range('2020-01-01', periods=40).strftime('%Y-%m-%d')
+    rows = []
+    for asset in ['AAPL', 'AMZN', 'SPX']:
+        for date in dates:
+            if rng.random() < 0.15:
+                continue
+            price = None if rng.random() < 0.05 else float(100 * np.exp(rng.normal(scale=0.02)))
+            rows.append((date, asset, price))
+    positions = [(1, 'AAPL', 300.0), (1, 'AMZN', 100.0), (2, 'SPX', 250.0), (2, 'AMZN', 0.0), (3, 'AMZN', 0.0)]
+    conn = sqlite3.connect(':memory:')
+    conn.execute('CREATE TABLE asset_prices (date TEXT, asset TEXT, adj_close REAL, PRIMARY KEY (date, asset))')
+    conn.execute('CREATE TABLE positions (fund_id INTEGER, asset TEXT, quantity REAL)')
+    conn.executemany('INSERT INTO asset_prices VALUES (?, ?, ?)', rows)
+    conn.executemany('INSERT INTO positions VALUES (?, ?, ?)', positions)
+
+    from_sql = load_portfolio_returns(conn)
+    prices = pd.read_sql_query('SELECT * FROM asset_prices', conn)
+    positions_df = pd.read_sql_query('SELECT * FROM positions', conn)
+    conn.close()
+    if categorical:
+        asset_dtype = pd.CategoricalDtype(pd.concat([prices['asset'], positions_df['asset']]).unique())
+        prices['asset'] = prices['asset'].astype(asset_dtype)
+        positions_df['asset'] = positions_df['asset'].astype(asset_dtype)
+    from_pandas = build_portfolio_returns(compute_asset_returns(prices), positions_df)
+
+    assert len(from_sql) > 0
+    pd.testing.assert_frame_equal(from_pandas, from_sql, check_dtype=False, rtol=1e-12)
+
+
+def reference_exposures(X, y):
+    # The original implementation: least squares, alpha as mean residual
+    betas, *_ = np.linalg.lstsq(X, y, rcond=None)
+    return betas, (y - X @ betas).mean(axis=0)
+
+
+@pytest.mark.parametrize('n_dates, zero_column', [(250, False), (3, False), (250, True)])
+def test_factor_exposures_match_least_squares(n_dates, zero_column):
+    # Too few dates or a constant-zero factor make X'X singular, where the
+    # minimum-norm least squares answer must still be returned
+    rng = np.random.default_rng(n_dates)
+    X = rng.normal(scale=0.01, size=(n_dates, 5))
+    if zero_column:
+        X[:, 3] = 0.0
+    Y = X @ rng.normal(size=(5, 3)) + rng.normal(scale=0.001, size=(n_dates, 3))
+    betas, alpha = estimate_factor_exposures(Y, X)
+    expected_betas, expected_alpha = reference_exposures(X, Y)
+    np.testing.assert_allclose(betas, expected_betas, rtol=1e-8, atol=1e-10)
+    np.testing.assert_allclose(alpha, expected_alpha, rtol=1e-8, atol=1e-12)
+    single_betas, single_alpha = estimate_factor_exposures(Y[:, 0], X)
+    np.testing.assert_allclose(single_betas, betas[:, 0], rtol=1e-8, atol=1e-10)
+    np.testing.assert_allclose(single_alpha, alpha[0], rtol=1e-8, atol=1e-12)